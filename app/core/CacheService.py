@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import struct
 from typing import Literal, Optional
@@ -16,13 +17,16 @@ _logger = logging.getLogger(__name__)
 class CacheService:
     """Data access layer for Redis-backed caches (L1, L2, and metrics)."""
 
-    CacheType = Literal["l1", "l2", "metrics"]
+    CacheType = Literal["l2", "metrics"]
 
     _VECTOR_INDEX = "idx:cache_vectors"
     _VECTOR_PREFIX = "vec:"
     _VECTOR_FIELD = "embedding"
     _CACHE_ID_FIELD = "cache_id"
     _QUERY_FIELD = "query"
+    _RESPONSE_FIELD = "response"
+    _L1_PREFIX = "l1h:"  # distinct from legacy plain-string l1:<query> keys
+    _L1_DIGEST_SIZE = 16  # bytes -> 32 hex chars
     _EMBED_DIM = 1536  # openai/text-embedding-3-small
 
     def __init__(self, redis_client) -> None:
@@ -37,6 +41,23 @@ class CacheService:
     def set(self, cache_type: CacheType, key: str, value: str, ttl: int) -> None:
         self._redis.set(self._format_key(cache_type, key), value, ex=ttl)
 
+    #l1 entries are hashes keyed by digest; the stored query guards against digest collisions
+    def get_l1(self, query: str) -> Optional[str]:
+        entry = self._redis.hgetall(self._l1_key(query))
+        if not entry:
+            return None
+        if entry.get(self._QUERY_FIELD) != query:
+            _logger.warning("L1 digest collision for query: %s", query)
+            return None
+        return entry.get(self._RESPONSE_FIELD)
+
+    def set_l1(self, query: str, response: str, ttl: int) -> None:
+        key = self._l1_key(query)
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping={self._QUERY_FIELD: query, self._RESPONSE_FIELD: response})
+        pipe.expire(key, ttl)
+        pipe.execute()
+
     def get_ttl(self, cache_type: CacheType, key: str) -> Optional[int]:
         value = self._redis.ttl(self._format_key(cache_type, key))
         if value is None or value < 0:
@@ -109,13 +130,23 @@ class CacheService:
             "l1_calls_total",
             "l2_calls_total",
             "llm_calls_total",
+            "embed_calls_total",
         ]
         return {k: self.get("metrics", k) for k in keys}
 
     @staticmethod
     def _format_key(cache_type: CacheType, key: str) -> str:
+        #l1 entries are hashes, only get_l1/set_l1 may touch them
+        if cache_type == "l1":
+            raise ValueError("Use get_l1/set_l1 for l1 entries")
         return f"{cache_type}:{key}"
 
+    #l1 keys are query text, so hash them to a fixed size
+    @classmethod
+    def _l1_key(cls, query: str) -> str:
+        digest = hashlib.blake2b(query.encode("utf-8"), digest_size=cls._L1_DIGEST_SIZE).hexdigest()
+        return f"{cls._L1_PREFIX}{digest}"
+
     def _create_vector_index(self) -> None:
         schema = [
             TagField(self._CACHE_ID_FIELD),
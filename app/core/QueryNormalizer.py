@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Callable, Iterable, Sequence
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCT = re.compile(r"[\s?!.,;:]+$")
+
+
+def nfkc(text: str) -> str:
+    return unicodedata.normalize("NFKC", text)
+
+
+def casefold(text: str) -> str:
+    return text.casefold()
+
+
+def collapse_whitespace(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def strip_trailing_punct(text: str) -> str:
+    stripped = _TRAILING_PUNCT.sub("", text)
+    #never normalise a query down to nothing (e.g. "???")
+    return stripped or text
+
+
+DEFAULT_STEPS: tuple[Callable[[str], str], ...] = (nfkc, casefold, collapse_whitespace, strip_trailing_punct)
+
+
+class QueryNormalizer:
+    """
+    Canonicalises query text before it is used as an L1 cache key.
+    Steps run in order; each one is a plain str -> str function and can be
+    replaced via `steps`. Stop phrases are normalised with the same steps and
+    stripped from both ends of the query until nothing changes.
+    """
+
+    def __init__(self, stop_phrases: Iterable[str] = (), steps: Sequence[Callable[[str], str]] | None = None) -> None:
+        self._steps = tuple(DEFAULT_STEPS if steps is None else steps)
+
+        phrases = {self._apply_steps(p) for p in stop_phrases}
+        phrases.discard("")
+        self._stop_phrases = tuple(sorted(phrases, key=len, reverse=True))
+
+    def normalize(self, query: str) -> str:
+        text = self._apply_steps(query)
+        if not self._stop_phrases:
+            return text
+
+        while True:
+            stripped = self._strip_stop_phrases(text)
+            if stripped == text:
+                return text
+            text = self._apply_steps(stripped)
+
+    def _apply_steps(self, text: str) -> str:
+        for step in self._steps:
+            text = step(text)
+        return text
+
+    def _strip_stop_phrases(self, text: str) -> str:
+        for phrase in self._stop_phrases:
+            if text.startswith(phrase + " "):
+                text = text[len(phrase) + 1 :]
+            if text.endswith(" " + phrase):
+                text = text[: -len(phrase) - 1]
+        return text
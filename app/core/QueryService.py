@@ -6,6 +6,7 @@ import uuid
 
 from app.core.CacheService import CacheService
 from app.core.LLMService import LLMService
+from app.core.QueryNormalizer import QueryNormalizer
 
 _logger = logging.getLogger(__name__)
 
@@ -16,9 +17,10 @@ class QueryService:
     This class owns decision-making only.
     """
 
-    def __init__(self, cache: CacheService, ai: LLMService) -> None:
+    def __init__(self, cache: CacheService, ai: LLMService, normalizer: QueryNormalizer | None = None) -> None:
         self._cache = cache
         self._ai = ai
+        self._normalizer = normalizer or QueryNormalizer()
         self._similarity_threshold = 0.9
 
     def handle_query(self, query: str, force_refresh: bool = False) -> dict:
@@ -49,15 +51,16 @@ class QueryService:
                 "metadata": {"source": "llm", "risk_level": risk_level, "force_refresh": force_refresh, "latency_ms": latency_ms},
             }
 
-        #check and return response from l1 cache
-        response = self._cache.get("l1", query)
+        #check and return response from l1 cache (keyed on the canonical query, skipped for blank queries)
+        canonical = self._normalizer.normalize(query)
+        response = self._cache.get_l1(canonical) if canonical else None
         if response is not None:
             latency_ms = self._cache.record_outcome("l1", start, f"L1 hit (risk={risk_level})")
             return {"response": response, "metadata": {"source": "cache", "cache_type": "l1", "risk_level": risk_level, "latency_ms": latency_ms}}
 
 
         #if l1 cache miss, embed query
-        embedding = self._ai.embed_query(query)
+        embedding = self._embed(query)
         
         #return best match in l2 cache from top k = 5 results from (ANN search using cosine similarity evaluation)
         knn = self._cache.ann_search(embedding, k=5)
@@ -107,6 +110,15 @@ class QueryService:
         }
 
 
+    def _write_l1(self, query: str, response: str, ttl: int) -> None:
+        canonical = self._normalizer.normalize(query)
+        if canonical:
+            self._cache.set_l1(canonical, response, ttl)
+
+    def _embed(self, query: str) -> list[float]:
+        self._cache.incr_metric("embed_calls_total", 1)
+        return self._ai.embed_query(query)
+
     def assess_query_staleness_risk(self, query: str) -> str:
         formatted_query = query.lower()
 
@@ -139,11 +151,11 @@ class QueryService:
             # Write to caches for LLM responses (embed if missing).
             if source == "llm" and risk_level != "high":
                 if embedding is None:
-                    embedding = self._ai.embed_query(query)
+                    embedding = self._embed(query)
                 ttl = self._ai.choose_ttl(query)
                 _logger.info("LLM helper determined TTL as: %s", ttl)
 
-                self._cache.set("l1", query, response, ttl)
+                self._write_l1(query, response, ttl)
 
                 new_cache_id = uuid.uuid4().hex
                 self._cache.set("l2", new_cache_id, response, ttl)
@@ -156,7 +168,7 @@ class QueryService:
                 ttl = self._cache.get_ttl("l2", cache_id)
                 if ttl is None:
                     return
-                self._cache.set("l1", query, response, ttl)
+                self._write_l1(query, response, ttl)
                 _logger.info("Promoted L2->L1 for query (ttl=%s cache_id=%s)", ttl, cache_id)
                 return
         except Exception as e:
@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 
 from app.core.CacheService import CacheService
 from app.core.LLMService import LLMService
+from app.core.QueryNormalizer import QueryNormalizer
 from app.core.QueryService import QueryService
 from app.loadtest import run_loadtest
 
@@ -39,7 +40,10 @@ _redis = redis.Redis(
 )
 
 _cache = CacheService(_redis)
-_flow = QueryService(cache=_cache, ai=LLMService())
+_normalizer = QueryNormalizer(
+    stop_phrases=[p for p in os.getenv("L1_STOP_PHRASES", "").split(",") if p.strip()],
+)
+_flow = QueryService(cache=_cache, ai=LLMService(), normalizer=_normalizer)
 
 
 @app.post("/api/query", response_model=QueryResponse)
@@ -0,0 +1,79 @@
+import pytest
+
+pytest.importorskip("redis")
+
+from app.core.CacheService import CacheService  # noqa: E402
+
+
+class _FakeIndex:
+    def create_index(self, *args, **kwargs):
+        return None
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+
+    def hset(self, key, mapping):
+        self._redis.hashes[key] = dict(mapping)
+
+    def expire(self, key, ttl):
+        return None
+
+    def execute(self):
+        return None
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ex=None):
+        return None
+
+    def ttl(self, key):
+        return -2
+
+    def ft(self, name):
+        return _FakeIndex()
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+def test_l1_roundtrip_uses_fixed_size_key():
+    redis = _FakeRedis()
+    cache = CacheService(redis)
+    cache.set_l1("q" * 10_000, "answer", 60)
+
+    (key,) = redis.hashes
+    assert key.startswith("l1h:") and len(key) == len("l1h:") + 32
+    assert cache.get_l1("q" * 10_000) == "answer"
+
+
+def test_l1_digest_collision_is_a_miss(monkeypatch):
+    redis = _FakeRedis()
+    cache = CacheService(redis)
+    monkeypatch.setattr(CacheService, "_l1_key", classmethod(lambda cls, query: "l1h:same"))
+
+    cache.set_l1("first query", "first answer", 60)
+    assert cache.get_l1("second query") is None
+    assert cache.get_l1("first query") == "first answer"
+
+
+def test_generic_accessors_reject_l1():
+    cache = CacheService(_FakeRedis())
+    with pytest.raises(ValueError):
+        CacheService._format_key("l1", "query")
+    with pytest.raises(ValueError):
+        cache.set("l1", "query", "answer", 60)
+    with pytest.raises(ValueError):
+        cache.get("l1", "query")
+    with pytest.raises(ValueError):
+        cache.get_ttl("l1", "query")
@@ -0,0 +1,61 @@
+import ast
+from pathlib import Path
+
+from app.core.QueryNormalizer import QueryNormalizer, casefold, collapse_whitespace
+
+STOP_PHRASES = ["in one sentence", "in the world"]
+
+
+def _soccer_variants() -> list[str]:
+    tree = ast.parse((Path(__file__).parent.parent / "load" / "locustfile.py").read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "SOCCER_L2_VARIANTS":
+            return ast.literal_eval(node.value)
+    raise AssertionError("SOCCER_L2_VARIANTS not found in load/locustfile.py")
+
+
+def test_nfkc_casefold_and_whitespace():
+    assert QueryNormalizer().normalize("Ｗho  is the\tbest SOCCER player ?") == "who is the best soccer player"
+
+
+def test_trailing_punctuation_only():
+    normalizer = QueryNormalizer()
+    assert normalizer.normalize("ls -a . done") == "ls -a . done"
+    assert normalizer.normalize("Who is it?!") == "who is it"
+
+
+def test_punctuation_only_query_is_kept():
+    assert QueryNormalizer().normalize("???") == "???"
+
+
+def test_blank_query_normalizes_to_empty():
+    assert QueryNormalizer().normalize("   ") == ""
+
+
+def test_stop_phrases_independent_of_order():
+    normalizer = QueryNormalizer(STOP_PHRASES)
+    assert normalizer.normalize("best player in the world in one sentence") == "best player"
+    assert normalizer.normalize("best player in one sentence in the world?") == "best player"
+
+
+def test_stop_phrase_stripped_from_both_ends():
+    assert QueryNormalizer(["please"]).normalize("Please explain recursion please") == "explain recursion"
+
+
+def test_stop_phrases_are_normalized_like_queries():
+    normalizer = QueryNormalizer(["ｆｕｌｌ", "In One Sentence.", "  "])
+    assert normalizer.normalize("Ｆull stop") == "stop"
+    assert normalizer.normalize("stop ｆｕｌｌ") == "stop"
+    assert normalizer.normalize("recursion in one sentence") == "recursion"
+
+
+def test_custom_steps():
+    assert QueryNormalizer(steps=[collapse_whitespace]).normalize("  Hello   World? ") == "Hello World?"
+    assert QueryNormalizer(steps=[casefold]).normalize("Hello") == "hello"
+
+
+def test_soccer_variant_key_counts():
+    variants = _soccer_variants()
+    assert len(set(variants)) == 14
+    assert len({QueryNormalizer().normalize(q) for q in variants}) == 9
+    assert len({QueryNormalizer(STOP_PHRASES).normalize(q) for q in variants}) == 5